@@ -1,8 +1,10 @@
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 
@@ -11,6 +13,14 @@ from signaljourney_validator.validator import (
     Validator,
 )
 
+# Optional orjson import for faster JSON output
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 JsonDict = Dict[str, Any]
 
 # Determine project structure relative to this file
@@ -21,6 +31,173 @@ DEFINITIONS_DIR = SCHEMA_DIR / "definitions"
 EXTENSIONS_DIR = SCHEMA_DIR / "extensions"
 
 
+def _has_float(obj: Any) -> bool:
+    """Returns whether a JSON-serializable value contains a float anywhere."""
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_float(item) for item in obj)
+    return False
+
+
+def _orjson_or_json(obj: Any, orjson_option: int, **json_kwargs: Any) -> str:
+    """
+    Serializes obj with orjson when available, else json.dumps(obj, **json_kwargs).
+
+    The output always matches json.dumps, which escapes non-ASCII characters and
+    so is safe to print to any stdout encoding. orjson is therefore skipped for
+    values holding floats, which it formats differently (1e16 rather than
+    1e+16, NaN as null), and its result is only used when it is pure ASCII:
+    it writes UTF-8 and rejects surrogate-escaped strings (e.g. undecodable
+    file names). Otherwise this falls back to the standard library.
+    """
+    if HAS_ORJSON and not _has_float(obj):
+        try:
+            data = orjson.dumps(obj, option=orjson_option)
+        except TypeError:
+            pass
+        else:
+            if data.isascii():
+                return data.decode("ascii")
+    return json.dumps(obj, **json_kwargs)
+
+
+def _dumps(obj: Any) -> str:
+    """Serializes obj as 2-space indented JSON, using orjson when available."""
+    return _orjson_or_json(obj, orjson.OPT_INDENT_2 if HAS_ORJSON else 0, indent=2)
+
+
+def _dumps_line(obj: Any) -> str:
+    """Serializes obj as compact single-line JSON, using orjson when available."""
+    return _orjson_or_json(obj, 0, separators=(",", ":"))
+
+
+def _validate_file(
+    validator: Validator, filepath: Path, bids_context: Optional[Path]
+) -> Tuple[JsonDict, Optional[str]]:
+    """
+    Validates one file and builds its JSON-serializable result record.
+
+    Returns:
+        The result record, and the message of an unexpected (critical) error
+        if one occurred, else None.
+    """
+    file_result: JsonDict = {
+        "filepath": str(filepath),
+        "status": "unknown",
+        "errors": [],
+    }
+    try:
+        validation_errors = validator.validate(
+            filepath, raise_exceptions=False, bids_context=bids_context
+        )
+    except SignalJourneyValidationError as e:
+        file_result["status"] = "error"
+        file_result["error_message"] = str(e)
+        # Include details from SignalJourneyValidationError if available
+        if e.errors:
+            file_result["errors"] = [
+                {"message": detail.message, "path": list(detail.path)}
+                for detail in e.errors
+            ]
+        return file_result, None
+    except Exception as e:
+        file_result["status"] = "error"
+        file_result["error_message"] = f"An unexpected error occurred: {e}"
+        return file_result, str(e)
+
+    if not validation_errors:
+        file_result["status"] = "passed"
+        return file_result, None
+
+    file_result["status"] = "failed"
+    append_error = file_result["errors"].append
+    for error in validation_errors:
+        # Store structured error
+        append_error(
+            {
+                "message": error.message,
+                "path": list(error.path) if error.path else [],
+                "schema_path": list(error.schema_path) if error.schema_path else [],
+                "validator": error.validator,
+                "validator_value": repr(error.validator_value),  # Use repr
+                "instance_value": repr(error.instance_value),  # Use repr
+                "suggestion": error.suggestion,
+            }
+        )
+    return file_result, None
+
+
+def _report_file_result(
+    file_result: JsonDict,
+    unexpected_error: Optional[str],
+    output_format: str,
+    verbose: bool,
+) -> None:
+    """Prints the outcome of a single file validation in text mode."""
+    if output_format != "text":
+        return
+    status = file_result["status"]
+    if status == "passed":
+        click.secho("PASSED", fg="green")
+    elif status == "failed":
+        click.secho("FAILED", fg="red")
+        for error in file_result["errors"]:
+            # Print detailed error
+            error_path_str = "/".join(map(str, error["path"])) or "root"
+            error_msg = f"  - Error at '{error_path_str}': {error['message']}"
+            if verbose:
+                # Add more details in verbose mode
+                error_msg += f" (validator: '{error['validator']}')"
+            if error["suggestion"]:
+                error_msg += f" -- Suggestion: {error['suggestion']}"
+            click.echo(error_msg)
+    elif unexpected_error is not None:
+        click.secho("CRITICAL ERROR", fg="red", bold=True)
+        click.echo(f"  - Unexpected Error: {unexpected_error}", err=True)
+    else:
+        click.secho("ERROR", fg="yellow")
+        click.echo(f"  - Validation Error: {file_result['error_message']}", err=True)
+        if file_result["errors"]:
+            click.echo("    Detailed Errors:", err=True)
+            for detail in file_result["errors"]:
+                click.echo(
+                    f"    - Path: {detail['path']}, Msg: {detail['message']}",
+                    err=True,
+                )
+
+
+# ProcessPoolExecutor rejects more workers than this on Windows
+_WINDOWS_MAX_WORKERS = 61
+
+
+def _worker_count(jobs: int, n_files: int) -> int:
+    """Returns the number of worker processes to use for --jobs (0 = all CPUs)."""
+    workers = min(jobs or os.cpu_count() or 1, n_files)
+    if sys.platform == "win32":
+        workers = min(workers, _WINDOWS_MAX_WORKERS)
+    return max(workers, 1)
+
+
+# Validator of the current --jobs worker process, set by _init_worker
+_worker_validator: Optional[Validator] = None
+
+
+def _init_worker(schema: Optional[Path]) -> None:
+    """Creates the Validator reused for every file handled by this process."""
+    global _worker_validator
+    _worker_validator = Validator(schema=schema)
+
+
+def _validate_file_in_worker(
+    filepath: Path, bids_context: Optional[Path]
+) -> Tuple[JsonDict, Optional[str]]:
+    """Validates a file with the worker process's Validator."""
+    return _validate_file(_worker_validator, filepath, bids_context)
+
+
 @click.group(context_settings=dict(help_option_names=["-h", "--help"]))
 @click.version_option(
     package_name="signaljourney-validator", prog_name="signaljourney-validate"
@@ -59,10 +236,11 @@ def cli():
 @click.option(
     "--output-format",
     "-o",
-    type=click.Choice(["text", "json"], case_sensitive=False),
+    type=click.Choice(["text", "json", "jsonl"], case_sensitive=False),
     default="text",
-    help='Output format: "text" (human-readable, default) or "json" '
-    "(machine-readable).",
+    help='Output format: "text" (human-readable, default), "json" '
+    '(machine-readable) or "jsonl" (one JSON object per file, written as each '
+    "file is validated).",
 )
 @click.option(
     "--verbose",
@@ -82,6 +260,15 @@ def cli():
     type=click.Path(exists=True, file_okay=False, path_type=Path, resolve_path=True),
     help="Path to the BIDS dataset root directory (required if --bids is used).",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to validate files in parallel "
+    "(0 uses all available CPUs).",
+)
 def validate(
     path: Path,
     schema: Path,
@@ -90,6 +277,7 @@ def validate(
     verbose: bool,
     bids: bool,
     bids_root: Path,
+    jobs: int,
 ):
     """
     Validate one or more signalJourney JSON files.
@@ -111,6 +299,10 @@ def validate(
 
         signaljourney-validate -r -o json path/to/bids_dataset/
 
+    Validate a large directory tree using all CPUs:
+
+        signaljourney-validate -r -j 0 path/to/bids_dataset/
+
     Validate with BIDS context checks:
 
         signaljourney-validate --bids --bids-root path/to/bids_dataset \\
@@ -168,7 +360,7 @@ def validate(
             )
         elif output_format == "json":
             # Output valid JSON even if no files processed
-            print(json.dumps({"files": [], "overall_success": True}, indent=2))
+            print(_dumps({"files": [], "overall_success": True}))
         # Exit code 0 if input dir was empty, 1 otherwise (e.g., non-JSON file input)
         sys.exit(0 if path.is_dir() else 1)
 
@@ -189,135 +381,91 @@ def validate(
     #     sys.exit(1)
     # --- End Schema Loading ---
 
+    current_bids_context = bids_root if bids else None
+    init_error: Optional[Exception] = None
+    try:
+        # Create validator ONCE using the schema path (or None for default)
+        validator_instance = Validator(schema=schema)
+    except Exception as e:
+        # Handle potential errors during Validator initialization
+        # (e.g., schema loading); they are reported for every file below.
+        init_error = e
+
+    def emit(file_result: JsonDict) -> None:
+        """Writes a file result immediately (jsonl) or collects it for output."""
+        if output_format == "jsonl":
+            print(_dumps_line(file_result), flush=True)
+        else:
+            results["files"].append(file_result)
+
+    workers = _worker_count(jobs, len(files_to_validate))
     overall_success = True
-    for filepath in files_to_validate:
-        file_result: Dict[str, Any] = {
-            "filepath": str(filepath),
-            "status": "unknown",
-            "errors": [],
-        }
-        if output_format == "text":
-            click.echo(f"Validating: {filepath} ... ", nl=False)
 
-        try:
-            if validator_instance is None:
-                # Create validator ONCE using the schema path (or None for default)
-                # Validator internal __init__ now handles registry setup.
-                try:
-                    # Pass schema path/None
-                    validator_instance = Validator(schema=schema)
-                except Exception as e:
-                    # Handle potential errors during Validator initialization
-                    # (e.g., schema loading)
-                    click.echo(f"CRITICAL ERROR initializing validator: {e}", err=True)
-                    # For JSON output, log the critical error at file level
-                    if output_format == "json":
-                        file_result["status"] = "critical_error"
-                        file_result["errors"] = [
-                            {"message": f"Validator init failed: {e}"}
-                        ]
-                        results["files"].append(file_result)
-                        results["overall_success"] = False
-                        overall_success = False  # Ensure overall failure
-                    # Exit or continue? Maybe continue to report errors for other files?
-                    # For now, let's make it a fatal error for the specific file.
-                    if output_format == "text":
-                        click.echo(" CRITICAL ERROR")
-                        click.echo(f"  - Initialization Failed: {e}")
-                    # Skip to the next file if validator init fails
-                    continue
-
-            # Pass bids_root to validator if bids flag is set
-            current_bids_context = bids_root if bids else None
-            validation_errors = validator_instance.validate(
-                filepath, raise_exceptions=False, bids_context=current_bids_context
+    if validator_instance is not None and workers > 1:
+        # Validate in worker processes, each holding its own Validator, and
+        # report results in input order as they complete. Files are sent in
+        # chunks (about four per worker) to cut per-file IPC overhead.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(schema,),
+        ) as executor:
+            outcomes = executor.map(
+                _validate_file_in_worker,
+                files_to_validate,
+                repeat(current_bids_context),
+                chunksize=max(1, len(files_to_validate) // (workers * 4)),
             )
-
-            if validation_errors:
-                overall_success = False
-                file_result["status"] = "failed"
-                if output_format == "text":
-                    click.secho("FAILED", fg="red")
-                for error in validation_errors:
-                    # Store structured error
-                    error_dict = {
-                        "message": error.message,
-                        "path": list(error.path) if error.path else [],
-                        "schema_path": list(error.schema_path)
-                        if error.schema_path
-                        else [],
-                        "validator": error.validator,
-                        "validator_value": repr(error.validator_value),  # Use repr
-                        "instance_value": repr(error.instance_value),  # Use repr
-                        "suggestion": error.suggestion,
-                    }
-                    file_result["errors"].append(error_dict)
-
-                    # Print detailed error in text mode
-                    if output_format == "text":
-                        error_path_list = list(error.path) if error.path else []
-                        error_path_str = (
-                            "/".join(map(str, error_path_list))
-                            if error_path_list
-                            else "root"
-                        )
-                        error_msg = f"  - Error at '{error_path_str}': {error.message}"
-                        if verbose:
-                            # Add more details in verbose mode
-                            error_msg += f" (validator: '{error.validator}')"
-                            # Add more details if needed
-                        if error.suggestion:
-                            error_msg += f" -- Suggestion: {error.suggestion}"
-                        click.echo(error_msg)
-            else:
-                file_result["status"] = "passed"
-                if output_format == "text":
-                    click.secho("PASSED", fg="green")
-
-        except SignalJourneyValidationError as e:
-            overall_success = False
-            file_result["status"] = "error"
-            file_result["error_message"] = str(e)
-            if output_format == "text":
-                click.secho("ERROR", fg="yellow")
-                click.echo(f"  - Validation Error: {e}", err=True)
-            # Include details from SignalJourneyValidationError if available
-            detailed_errors = []
-            if (
-                isinstance(e, SignalJourneyValidationError)
-                and hasattr(e, "errors")
-                and e.errors
+            for filepath, (file_result, unexpected_error) in zip(
+                files_to_validate, outcomes
             ):
-                detailed_errors = [
-                    {
-                        "message": detail.get("message", "N/A"),
-                        "path": detail.get("path", []),
-                        # Add other relevant fields from ValidationErrorDetail if needed
-                    }
-                    for detail in e.errors
-                ]
-                file_result["errors"] = detailed_errors  # Overwrite with details
                 if output_format == "text":
-                    click.echo("    Detailed Errors:", err=True)
-                    for detail in detailed_errors:
-                        path_str = detail.get("path", "N/A")
-                        msg_str = detail.get("message", "N/A")
-                        click.echo(f"    - Path: {path_str}, Msg: {msg_str}", err=True)
-
-        except Exception as e:
-            overall_success = False
-            file_result["status"] = "error"
-            file_result["error_message"] = f"An unexpected error occurred: {e}"
+                    click.echo(f"Validating: {filepath} ... ", nl=False)
+                _report_file_result(
+                    file_result, unexpected_error, output_format, verbose
+                )
+                emit(file_result)
+                if file_result["status"] != "passed":
+                    overall_success = False
+    else:
+        for filepath in files_to_validate:
             if output_format == "text":
-                click.secho("CRITICAL ERROR", fg="red", bold=True)
-                click.echo(f"  - Unexpected Error: {e}", err=True)
+                click.echo(f"Validating: {filepath} ... ", nl=False)
 
-        results["files"].append(file_result)
+            if validator_instance is None:
+                overall_success = False
+                click.echo(
+                    f"CRITICAL ERROR initializing validator: {init_error}", err=True
+                )
+                # For JSON output, log the critical error at file level
+                if output_format != "text":
+                    emit(
+                        {
+                            "filepath": str(filepath),
+                            "status": "critical_error",
+                            "errors": [
+                                {"message": f"Validator init failed: {init_error}"}
+                            ],
+                        }
+                    )
+                if output_format == "text":
+                    click.echo(" CRITICAL ERROR")
+                    click.echo(f"  - Initialization Failed: {init_error}")
+                # Skip to the next file if validator init fails
+                continue
+
+            file_result, unexpected_error = _validate_file(
+                validator_instance, filepath, current_bids_context
+            )
+            _report_file_result(file_result, unexpected_error, output_format, verbose)
+            emit(file_result)
+            if file_result["status"] != "passed":
+                overall_success = False
 
     results["overall_success"] = overall_success
 
     if output_format == "json":
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
     elif output_format == "text" and verbose:
         # Add a summary line in verbose text mode
         status_msg = (
@@ -1,20 +1,36 @@
+import importlib.util
+import sys
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Union
 
-# Optional fuzzywuzzy import
-try:
-    from fuzzywuzzy import process as fuzzy_process
+# Optional fuzzywuzzy support. It is only needed for enum suggestions, so the
+# package is located here but imported on first use by _get_fuzzy_process.
+HAS_FUZZY = importlib.util.find_spec("fuzzywuzzy") is not None
+_fuzzy_process: Any = None
 
-    HAS_FUZZY = True
-except ImportError:
-    HAS_FUZZY = False
 
-# Moved import to top
+def _get_fuzzy_process() -> Any:
+    """Returns the fuzzywuzzy.process module, importing it on first use."""
+    global HAS_FUZZY, _fuzzy_process
+    if _fuzzy_process is None and HAS_FUZZY:
+        try:
+            from fuzzywuzzy import process
+        except Exception:
+            # Found but not importable: don't retry on every enum error
+            HAS_FUZZY = False
+        else:
+            _fuzzy_process = process
+    return _fuzzy_process
+
 
 JsonPath = Union[str, int]
 
+# Use __slots__ for error details where dataclasses support it (Python 3.10+);
+# large documents can produce many errors, so this trims per-instance memory.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationErrorDetail:
     """Represents a detailed validation error."""
 
@@ -41,140 +57,117 @@ class ValidationErrorDetail:
 
     def _generate_suggestion(self):
         """Internal method to populate the suggestion field based on validator type."""
-        if self.validator == "required":
-            # 'validator_value' usually holds the list of required properties
-            missing_props = self.validator_value
-            if isinstance(missing_props, list):
-                props_str = "', '".join(missing_props)
-                self.suggestion = (
-                    f"Ensure required property or properties ('{props_str}') "
-                    f"are present."
-                )
-            else:
-                self.suggestion = (
-                    "Ensure required property is present (check schema for details)."
-                )
-
-        elif self.validator == "type":
-            expected_types = self.validator_value
-            actual_type = type(self.instance_value).__name__
-            if isinstance(expected_types, list):
-                types_str = "', '".join(expected_types)
-                self.suggestion = (
-                    f"Change value type from '{actual_type}' to one of: '{types_str}'."
-                )
-            elif isinstance(expected_types, str):
-                self.suggestion = (
-                    f"Change value type from '{actual_type}' to '{expected_types}'."
-                )
-            else:
-                self.suggestion = (
-                    f"Check schema for expected type(s) instead of '{actual_type}'."
-                )
-
-        elif self.validator == "pattern":
-            pattern = self.validator_value
-            self.suggestion = (
-                f"Ensure value matches the required regex pattern: '{pattern}'."
-            )
-
-        elif self.validator == "enum":
-            allowed_values = self.validator_value
-            if isinstance(allowed_values, list):
-                suggestion_text = (
-                    f"Value must be one of: {', '.join(map(repr, allowed_values))}."
-                )
-                # Optional: Add fuzzy matching
-                if (
-                    HAS_FUZZY
-                    and isinstance(self.instance_value, str)
-                    and self.instance_value
-                ):
-                    try:
-                        # Filter for string choices
-                        string_allowed_values = [
-                            str(v) for v in allowed_values if isinstance(v, str)
-                        ]
-                        if string_allowed_values:
-                            best_match, score = fuzzy_process.extractOne(
-                                self.instance_value, string_allowed_values
-                            )
-                            if score > 80:  # Threshold
-                                suggestion_text += f" Did you mean '{best_match}'?"
-                    except Exception:
-                        pass  # Ignore fuzzy matching errors
-                self.suggestion = suggestion_text
-            else:
-                self.suggestion = (
-                    "Ensure value is one of the allowed options (check schema)."
-                )
-
-        # Add suggestions for length/item constraints
-        elif self.validator == "minLength":
-            min_len = self.validator_value
-            actual_len = (
-                len(self.instance_value)
-                if isinstance(self.instance_value, (str, list))
-                else "N/A"
-            )
-            self.suggestion = (
-                f"Ensure value has at least {min_len} characters/items "
-                f"(currently {actual_len})."
-            )
-
-        elif self.validator == "maxLength":
-            max_len = self.validator_value
-            actual_len = (
-                len(self.instance_value)
-                if isinstance(self.instance_value, (str, list))
-                else "N/A"
-            )
-            self.suggestion = (
-                f"Ensure value has at most {max_len} characters/items "
-                f"(currently {actual_len})."
-            )
-
-        elif self.validator == "minItems":
-            min_num = self.validator_value
-            actual_num = (
-                len(self.instance_value)
-                if isinstance(self.instance_value, list)
-                else "N/A"
+        suggester = self._SUGGESTERS.get(self.validator)
+        if suggester is not None:
+            self.suggestion = suggester(self)
+
+    def _suggest_required(self) -> str:
+        # 'validator_value' usually holds the list of required properties
+        missing_props = self.validator_value
+        if isinstance(missing_props, list):
+            props_str = "', '".join(missing_props)
+            return (
+                f"Ensure required property or properties ('{props_str}') are present."
             )
-            self.suggestion = (
-                f"Ensure array has at least {min_num} items (currently {actual_num})."
-            )
-
-        elif self.validator == "maxItems":
-            max_num = self.validator_value
-            actual_num = (
-                len(self.instance_value)
-                if isinstance(self.instance_value, list)
-                else "N/A"
-            )
-            self.suggestion = (
-                f"Ensure array has at most {max_num} items (currently {actual_num})."
-            )
-
-        elif self.validator == "minimum":
-            min_val = self.validator_value
-            self.suggestion = f"Ensure value is at least {min_val}."
-
-        elif self.validator == "maximum":
-            max_val = self.validator_value
-            self.suggestion = f"Ensure value is at most {max_val}."
-
-        elif self.validator == "exclusiveMinimum":
-            ex_min_val = self.validator_value
-            self.suggestion = f"Ensure value is strictly greater than {ex_min_val}."
-
-        elif self.validator == "exclusiveMaximum":
-            ex_max_val = self.validator_value
-            self.suggestion = f"Ensure value is strictly less than {ex_max_val}."
-
-        # TODO: Add more specific suggestions based on common
-        #       signalJourney patterns later
-        # e.g., based on error.schema_path or specific known field constraints
+        return "Ensure required property is present (check schema for details)."
+
+    def _suggest_type(self) -> str:
+        expected_types = self.validator_value
+        actual_type = type(self.instance_value).__name__
+        if isinstance(expected_types, list):
+            types_str = "', '".join(expected_types)
+            return f"Change value type from '{actual_type}' to one of: '{types_str}'."
+        if isinstance(expected_types, str):
+            return f"Change value type from '{actual_type}' to '{expected_types}'."
+        return f"Check schema for expected type(s) instead of '{actual_type}'."
+
+    def _suggest_pattern(self) -> str:
+        pattern = self.validator_value
+        return f"Ensure value matches the required regex pattern: '{pattern}'."
+
+    def _suggest_enum(self) -> str:
+        allowed_values = self.validator_value
+        if not isinstance(allowed_values, list):
+            return "Ensure value is one of the allowed options (check schema)."
+        suggestion_text = (
+            f"Value must be one of: {', '.join(map(repr, allowed_values))}."
+        )
+        # Optional: Add fuzzy matching
+        fuzzy_process = (
+            _get_fuzzy_process()
+            if isinstance(self.instance_value, str) and self.instance_value
+            else None
+        )
+        if fuzzy_process is not None:
+            try:
+                # Filter for string choices
+                string_allowed_values = [
+                    str(v) for v in allowed_values if isinstance(v, str)
+                ]
+                if string_allowed_values:
+                    best_match, score = fuzzy_process.extractOne(
+                        self.instance_value, string_allowed_values
+                    )
+                    if score > 80:  # Threshold
+                        suggestion_text += f" Did you mean '{best_match}'?"
+            except Exception:
+                pass  # Ignore fuzzy matching errors
+        return suggestion_text
+
+    # Add suggestions for length/item constraints and numeric bounds
+    def _suggest_length(self) -> str:
+        actual_len = (
+            len(self.instance_value)
+            if isinstance(self.instance_value, (str, list))
+            else "N/A"
+        )
+        return (
+            f"Ensure value has {self._BOUNDS[self.validator]} {self.validator_value} "
+            f"characters/items (currently {actual_len})."
+        )
+
+    def _suggest_item_count(self) -> str:
+        actual_num = (
+            len(self.instance_value) if isinstance(self.instance_value, list) else "N/A"
+        )
+        return (
+            f"Ensure array has {self._BOUNDS[self.validator]} {self.validator_value} "
+            f"items (currently {actual_num})."
+        )
+
+    def _suggest_bound(self) -> str:
+        return f"Ensure value is {self._BOUNDS[self.validator]} {self.validator_value}."
+
+    # Wording of the limit for each size/range keyword
+    _BOUNDS: ClassVar[Dict[str, str]] = {
+        "minLength": "at least",
+        "maxLength": "at most",
+        "minItems": "at least",
+        "maxItems": "at most",
+        "minimum": "at least",
+        "maximum": "at most",
+        "exclusiveMinimum": "strictly greater than",
+        "exclusiveMaximum": "strictly less than",
+    }
+
+    # Maps jsonschema validator keywords to their suggestion builders.
+    # TODO: Add more specific suggestions based on common
+    #       signalJourney patterns later
+    # e.g., based on error.schema_path or specific known field constraints
+    _SUGGESTERS: ClassVar[Dict[str, Callable[["ValidationErrorDetail"], str]]] = {
+        "required": _suggest_required,
+        "type": _suggest_type,
+        "pattern": _suggest_pattern,
+        "enum": _suggest_enum,
+        "minLength": _suggest_length,
+        "maxLength": _suggest_length,
+        "minItems": _suggest_item_count,
+        "maxItems": _suggest_item_count,
+        "minimum": _suggest_bound,
+        "maximum": _suggest_bound,
+        "exclusiveMinimum": _suggest_bound,
+        "exclusiveMaximum": _suggest_bound,
+    }
 
 
 # --- Custom Exception ---
@@ -1,21 +1,70 @@
 import json
+import os
+import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import jsonschema
 from jsonschema import Draft202012Validator
 
 from .errors import SignalJourneyValidationError, ValidationErrorDetail
 
+# Resolve the unresolvable-$ref exception type once at import. jsonschema >= 4.18
+# raises referencing's Unresolvable and only exposes RefResolutionError through
+# a deprecated module attribute.
+try:
+    from referencing.exceptions import Unresolvable as _RefResolutionError
+except ImportError:  # jsonschema < 4.18
+    _RefResolutionError = jsonschema.RefResolutionError
+
 # Type alias for JSON dictionary
 JsonDict = Dict[str, Any]
 
+# Sort key for jsonschema errors (their location within the instance)
+_error_path = attrgetter("path")
+
 DEFAULT_SCHEMA_PATH = (
     Path(__file__).parent.parent.parent / "schema" / "signalJourney.schema.json"
 )
 
+# Fully inlined and checked schemas, shared between Validator instances. Keyed
+# by the absolute path of the main schema file, with one entry per file. Each
+# entry records the (path, mtime_ns, size) of the main file and of every file
+# inlined through $ref, and is only reused while none of them has changed.
+FileStamp = Tuple[str, int, int]
+_RESOLVED_SCHEMA_CACHE: Dict[str, Tuple[Tuple[FileStamp, ...], JsonDict]] = {}
+
+
+def _file_stamp(path: str) -> Optional[FileStamp]:
+    """Returns the (path, mtime_ns, size) stamp of a file, if it exists."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_schema(cache_key: str) -> Optional[JsonDict]:
+    """Returns the cached resolved schema if none of its files has changed."""
+    entry = _RESOLVED_SCHEMA_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    stamps, schema = entry
+    if any(_file_stamp(stamp[0]) != stamp for stamp in stamps):
+        return None
+    return schema
+
+
 # --- Helper Function for Inlining Refs ---
 
+# Keywords whose values are JSON instances rather than subschemas
+_INSTANCE_KEYWORDS = frozenset({"const", "default", "enum", "examples"})
+# Keywords whose values map arbitrary names to subschemas
+_SCHEMA_MAP_KEYWORDS = frozenset(
+    {"$defs", "definitions", "dependentSchemas", "patternProperties", "properties"}
+)
+
 
 def inline_refs(
     schema: Union[Dict, list], base_path: Path, loaded_schemas_cache: Dict[str, Dict]
@@ -24,6 +73,8 @@ def inline_refs(
     Uses a cache (loaded_schemas_cache) to avoid infinite loops with circular refs
     and redundant file loading.
     Cache keys should be absolute POSIX paths of the schema files.
+    Values of instance keywords (const, default, enum, examples) are kept as is,
+    since any "$ref" inside them is data rather than a reference.
     """
     if isinstance(schema, dict):
         if (
@@ -66,20 +117,36 @@ def inline_refs(
                 except Exception as e:
                     print(
                         f"Warning: Failed to load or parse $ref: {ref_path_str} "
-                        f"from {ref_path}. Error: {e}"
+                        f"from {ref_path}. Error: {e}",
+                        file=sys.stderr,
                     )
                     return schema  # Keep original $ref on error
             else:
                 print(
                     f"Warning: $ref path does not exist or is not a file: "
-                    f"{ref_path_str} -> {ref_path}"
+                    f"{ref_path_str} -> {ref_path}",
+                    file=sys.stderr,
                 )
                 return schema  # Keep original $ref if file not found
         else:
             # Recursively process other keys in the dictionary
             new_schema = {}
             for key, value in schema.items():
-                new_schema[key] = inline_refs(value, base_path, loaded_schemas_cache)
+                if key in _INSTANCE_KEYWORDS:
+                    # Values are JSON instances, not subschemas: nothing to inline
+                    new_schema[key] = value
+                elif key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+                    # Keys are property/definition names (which may shadow
+                    # keywords, e.g. a property called "default"), values are
+                    # subschemas
+                    new_schema[key] = {
+                        name: inline_refs(subschema, base_path, loaded_schemas_cache)
+                        for name, subschema in value.items()
+                    }
+                else:
+                    new_schema[key] = inline_refs(
+                        value, base_path, loaded_schemas_cache
+                    )
             return new_schema
     elif isinstance(schema, list):
         # Recursively process items in the list
@@ -108,9 +175,23 @@ class Validator:
         Args:
             schema: Path to the schema file, the schema dictionary, or None
                     to use the default schema. External file $refs will be
-                    automatically inlined during initialization.
+                    automatically inlined during initialization. Schemas
+                    loaded from a file are inlined and checked once and then
+                    shared by later Validator instances using the same file.
         """
         schema_path = self._get_schema_path(schema)
+
+        # Reuse a previously inlined and checked schema loaded from the same
+        # files. The main file is stamped before it is read so an edit made
+        # while loading invalidates the entry on the next lookup.
+        cache_key = schema_path.resolve().as_posix() if schema_path else None
+        main_stamp = _file_stamp(cache_key) if cache_key else None
+        cached_schema = _cached_schema(cache_key) if main_stamp else None
+        if cached_schema is not None:
+            self._schema = cached_schema
+            self._validator = Draft202012Validator(schema=self._schema)
+            return
+
         initial_schema = self._load_schema_dict(schema, schema_path)
 
         # For simplicity, let's assume if it's a dict, it might not have relative refs,
@@ -120,14 +201,8 @@ class Validator:
         )
 
         # Inline external $refs
-        print("\n--- Inlining schema refs within Validator ---")
         loaded_cache = {}
         self._schema = inline_refs(initial_schema, base_resolve_path, loaded_cache)
-        print("--- Inlining complete --- \n")
-
-        # Debug: Check if refs are actually gone (optional)
-        # import pprint
-        # pprint.pprint(self._schema)
 
         # Initialize the validator with the resolved schema.
         try:
@@ -139,6 +214,14 @@ class Validator:
         except jsonschema.SchemaError as e:
             raise SignalJourneyValidationError(f"Invalid schema provided: {e}") from e
 
+        if main_stamp:
+            ref_stamps = [_file_stamp(path) for path in loaded_cache]
+            if all(ref_stamps):
+                _RESOLVED_SCHEMA_CACHE[cache_key] = (
+                    (main_stamp, *ref_stamps),
+                    self._schema,
+                )
+
     def _get_schema_path(
         self, schema_input: Optional[Union[Path, str, JsonDict]]
     ) -> Optional[Path]:
@@ -232,23 +315,23 @@ class Validator:
         # Use the internal validator's iter_errors method
         try:
             # The validator now uses the registry passed during __init__
-            errors = sorted(self._validator.iter_errors(instance), key=lambda e: e.path)
-            if errors:
-                for error in errors:
-                    # Convert jsonschema error to our custom format
-                    detail = ValidationErrorDetail(
-                        message=error.message,
-                        path=list(error.path),
-                        schema_path=list(error.schema_path),
-                        validator=error.validator,
-                        validator_value=error.validator_value,
-                        instance_value=error.instance,
-                        # suggestion is added by ValidationErrorDetail constructor
-                    )
-                    schema_errors.append(detail)
-        except jsonschema.RefResolutionError as e:
+            errors = sorted(self._validator.iter_errors(instance), key=_error_path)
+            # Convert jsonschema errors to our custom format
+            schema_errors = [
+                ValidationErrorDetail(
+                    message=error.message,
+                    path=list(error.path),
+                    schema_path=list(error.schema_path),
+                    validator=error.validator,
+                    validator_value=error.validator_value,
+                    instance_value=error.instance,
+                    # suggestion is added by ValidationErrorDetail constructor
+                )
+                for error in errors
+            ]
+        except _RefResolutionError as e:
             # This shouldn't happen if schema is fully resolved, but handle defensively
-            print(f"DEBUG: Unexpected RefResolutionError: {e}")
+            print(f"DEBUG: Unexpected RefResolutionError: {e}", file=sys.stderr)
             failed_ref = getattr(e, "ref", "[unknown ref]")
             raise SignalJourneyValidationError(
                 f"Schema validation failed: Unexpectedly could not resolve "
@@ -261,7 +344,8 @@ class Validator:
             # Capture the actual exception type for better debugging
             print(
                 f"DEBUG: Unexpected validation error type: "
-                f"{type(e).__name__}, Error: {e}"
+                f"{type(e).__name__}, Error: {e}",
+                file=sys.stderr,
             )
             # Reraise or wrap depending on desired behavior
             raise SignalJourneyValidationError(
@@ -294,7 +378,8 @@ class Validator:
         errors: List[ValidationErrorDetail] = []
         print(
             f"[INFO] BIDS context validation requested for {file_path} "
-            f"within {bids_root} (Not implemented)"
+            f"within {bids_root} (Not implemented)",
+            file=sys.stderr,
         )
 
         # TODO: Implement BIDS checks using file_path and bids_root
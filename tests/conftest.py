@@ -2,7 +2,6 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Union
 
 import pytest
 
@@ -76,75 +75,6 @@ def all_schemas(main_schema, main_schema_path):
     return store
 
 
-# --- Helper Function for Inlining Refs ---
-def inline_refs(
-    schema: Union[Dict, list], base_path: Path, loaded_schemas_cache: Dict[str, Dict]
-):
-    """Recursively replace $ref keys with the content of the referenced file."""
-    if isinstance(schema, dict):
-        if (
-            "$ref" in schema
-            and isinstance(schema["$ref"], str)
-            and not schema["$ref"].startswith("#")
-        ):
-            ref_path_str = schema["$ref"]
-            # Resolve relative ref path against the current base path
-            ref_path = (base_path / ref_path_str).resolve()
-
-            # Cache key based on resolved absolute path
-            cache_key = ref_path.as_posix()
-
-            # Check cache first
-            if cache_key in loaded_schemas_cache:
-                # Return a copy to prevent modification issues during recursion
-                return loaded_schemas_cache[cache_key].copy()
-
-            # If not cached, load the file
-            if ref_path.exists() and ref_path.is_file():
-                try:
-                    print(
-                        f"[Inline] Loading $ref: {ref_path_str} "
-                        f"(from {base_path}) -> {ref_path}"
-                    )
-                    with open(ref_path, "r", encoding="utf-8") as f:
-                        ref_content = json.load(f)
-                    # Store in cache BEFORE recursion to handle circular refs
-                    loaded_schemas_cache[cache_key] = ref_content
-                    # Recursively resolve refs *within* the loaded content
-                    # Use the directory of the *referenced* file as the new base path
-                    resolved_content = inline_refs(
-                        ref_content, ref_path.parent, loaded_schemas_cache
-                    )
-                    # Update cache with the fully resolved content
-                    loaded_schemas_cache[cache_key] = resolved_content
-                    # Return a copy of the resolved content
-                    return resolved_content.copy()
-                except Exception as e:
-                    print(
-                        f"Warning: Failed to load or parse $ref: {ref_path_str} "
-                        f"from {ref_path}. Error: {e}"
-                    )
-                    return schema  # Keep original $ref on error
-            else:
-                print(
-                    f"Warning: $ref path does not exist or is not a file: "
-                    f"{ref_path_str} -> {ref_path}"
-                )
-                return schema  # Keep original $ref if file not found
-        else:
-            # Recursively process other keys in the dictionary
-            new_schema = {}
-            for key, value in schema.items():
-                new_schema[key] = inline_refs(value, base_path, loaded_schemas_cache)
-            return new_schema
-    elif isinstance(schema, list):
-        # Recursively process items in the list
-        return [inline_refs(item, base_path, loaded_schemas_cache) for item in schema]
-    else:
-        # Return non-dict/list items as is
-        return schema
-
-
 @pytest.fixture(scope="session")
 def validator(main_schema):
     """Provides a Validator instance initialized with the main schema content.
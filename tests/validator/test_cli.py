@@ -1,10 +1,14 @@
 """Unit tests for the signaljourney_validator.cli module."""
 
+import json
+import os
+import sys
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
+from signaljourney_validator import cli as cli_module
 from signaljourney_validator.cli import cli
 
 # Calculate path relative to this test file
@@ -74,6 +78,139 @@ def test_cli_validate_directory(runner):
     assert "PASSED" in result.output
 
 
+def test_cli_validate_json_output(runner):
+    """Test JSON output is a single parseable document on stdout."""
+    valid_file = EXAMPLES_DIR / "valid/minimal_valid.json"
+    result = runner.invoke(cli, ["validate", "-o", "json", str(valid_file)])
+    assert result.exit_code == 0
+    report = json.loads(result.stdout)
+    assert report["overall_success"] is True
+    assert [entry["status"] for entry in report["files"]] == ["passed"]
+
+
 # TODO: Add tests for recursive validation
-# TODO: Add tests for JSON output format
 # TODO: Add tests for BIDS options
+
+
+# Reports exercising ASCII, non-ASCII and surrogate-escaped (undecodable
+# file name) strings, and floats that orjson formats differently from json
+DUMPS_REPORTS = [
+    {
+        "overall_success": False,
+        "files": [{"filepath": "a.json", "status": "failed", "errors": []}],
+    },
+    {"files": [{"filepath": "b.json", "instance_value": "'\u00fc'"}]},
+    {"files": [{"filepath": "\udcff_signalJourney.json", "status": "passed"}]},
+    {"values": [1e16, 1.5e-7, 0.5, {"nested": -2.5e-300}]},
+]
+
+
+@pytest.mark.parametrize(
+    "dumps, json_kwargs",
+    [
+        (cli_module._dumps, {"indent": 2}),
+        (cli_module._dumps_line, {"separators": (",", ":")}),
+    ],
+    ids=["json", "jsonl"],
+)
+@pytest.mark.parametrize("report", DUMPS_REPORTS)
+def test_dumps_matches_stdlib_json(monkeypatch, dumps, json_kwargs, report):
+    """Test output is identical, and ASCII-only, with and without orjson."""
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(cli_module, "HAS_ORJSON", True)
+    with_orjson = dumps(report)
+    monkeypatch.setattr(cli_module, "HAS_ORJSON", False)
+    without_orjson = dumps(report)
+    assert with_orjson == without_orjson == json.dumps(report, **json_kwargs)
+    assert with_orjson.isascii()
+    assert json.loads(with_orjson) == report
+
+
+def test_dumps_non_finite_floats_match_stdlib_json():
+    """Test NaN and infinities are written as json does (orjson writes null)."""
+    report = {"values": [float("nan"), float("inf"), -float("inf")]}
+    assert cli_module._dumps_line(report) == '{"values":[NaN,Infinity,-Infinity]}'
+
+
+def test_dumps_escapes_non_ascii():
+    """Test non-ASCII characters are written as JSON escapes."""
+    assert cli_module._dumps({"v": "\u00fc"}) == '{\n  "v": "\\u00fc"\n}'
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="needs a file system allowing non-UTF-8 names"
+)
+def test_cli_validate_json_undecodable_filename(runner, tmp_path):
+    """Test JSON output handles file names that are not valid UTF-8."""
+    valid_bytes = (EXAMPLES_DIR / "valid/minimal_valid.json").read_bytes()
+    bad_name = os.path.join(os.fsencode(tmp_path), b"\xff_signalJourney.json")
+    with open(bad_name, "wb") as f:
+        f.write(valid_bytes)
+    result = runner.invoke(cli, ["validate", "-r", "-o", "json", str(tmp_path)])
+    assert result.exit_code == 0
+    report = json.loads(result.stdout)
+    assert report["files"][0]["filepath"] == os.fsdecode(bad_name)
+
+
+def test_cli_validate_directory_parallel(runner, tmp_path):
+    """Test validating a directory with worker processes keeps results in order."""
+    valid_text = (EXAMPLES_DIR / "valid/minimal_valid.json").read_text()
+    invalid_text = (EXAMPLES_DIR / "invalid/wrong_type.json").read_text()
+    for index in range(4):
+        text = invalid_text if index == 2 else valid_text
+        (tmp_path / f"sub-0{index}_signalJourney.json").write_text(text)
+
+    serial = runner.invoke(cli, ["validate", "-r", str(tmp_path)])
+    parallel = runner.invoke(cli, ["validate", "-r", "-j", "2", str(tmp_path)])
+    assert parallel.exit_code == serial.exit_code == 1
+    assert parallel.output == serial.output
+    assert parallel.output.count("PASSED") == 3
+    assert "Change value type from 'float' to 'string'." in parallel.output
+
+
+@pytest.mark.parametrize(
+    "platform, jobs, n_files, expected",
+    [
+        ("linux", 4, 10, 4),
+        ("linux", 8, 3, 3),
+        ("linux", 100, 200, 100),
+        ("win32", 100, 200, 61),
+        ("win32", 4, 10, 4),
+        ("linux", 4, 0, 1),
+    ],
+)
+def test_worker_count(monkeypatch, platform, jobs, n_files, expected):
+    """Test --jobs is limited by the file count and the Windows worker cap."""
+    monkeypatch.setattr(cli_module.sys, "platform", platform)
+    assert cli_module._worker_count(jobs, n_files) == expected
+
+
+def test_worker_count_all_cpus(monkeypatch):
+    """Test --jobs 0 uses every CPU, still capped on Windows."""
+    monkeypatch.setattr(cli_module.os, "cpu_count", lambda: 128)
+    monkeypatch.setattr(cli_module.sys, "platform", "win32")
+    assert cli_module._worker_count(0, 500) == 61
+
+
+def test_cli_validate_jsonl_output(runner):
+    """Test jsonl output writes one compact JSON record per validated file."""
+    invalid_dir = EXAMPLES_DIR / "invalid"
+    result = runner.invoke(cli, ["validate", "-o", "jsonl", str(invalid_dir)])
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(records) == len(list(invalid_dir.glob("*.json")))
+    assert all(record["status"] == "failed" for record in records)
+    assert all(record["errors"] for record in records)
+
+
+def test_cli_validate_jsonl_non_ascii(runner, tmp_path):
+    """Test jsonl output escapes non-ASCII values from the validated document."""
+    data = json.loads((EXAMPLES_DIR / "valid/minimal_valid.json").read_text())
+    data["sj_version"] = "\u00fc"  # Fails the version pattern
+    data_file = tmp_path / "sub-01_signalJourney.json"
+    data_file.write_text(json.dumps(data), encoding="utf-8")
+    result = runner.invoke(cli, ["validate", "-o", "jsonl", str(data_file)])
+    assert result.exit_code == 1
+    assert result.stdout.isascii()
+    (record,) = [json.loads(line) for line in result.stdout.splitlines()]
+    assert any(error["instance_value"] == "'\u00fc'" for error in record["errors"])
@@ -1,11 +1,22 @@
 """Unit tests for the signaljourney_validator.validator module."""
 
+import os
+import subprocess
+import sys
+import types
+import warnings
 from pathlib import Path
 
 import pytest
 
+from signaljourney_validator import errors as errors_module
 from signaljourney_validator.errors import ValidationErrorDetail
-from signaljourney_validator.validator import SignalJourneyValidationError, Validator
+from signaljourney_validator.validator import (
+    _RESOLVED_SCHEMA_CACHE,
+    SignalJourneyValidationError,
+    Validator,
+    inline_refs,
+)
 
 # from pathlib import Path # Unused
 # from jsonschema import ValidationError # Unused
@@ -122,3 +133,144 @@ def test_validate_suggestions(validator, load_json_example):
 
 def test_validator_init_schema_path(main_schema_path):
     """Test initializing Validator with a schema path."""
+
+
+def test_validator_reuses_resolved_schema(main_schema_path):
+    """Validators created from the same schema file share the inlined schema."""
+    first = Validator(schema=main_schema_path)
+    second = Validator(schema=main_schema_path)
+    assert second._schema is first._schema
+
+
+def test_validator_schema_cache_tracks_file_changes(tmp_path):
+    """Editing a schema file invalidates the cached resolved schema."""
+    schema_file = tmp_path / "custom.schema.json"
+    schema_file.write_text('{"type": "object"}', encoding="utf-8")
+    assert Validator(schema=schema_file).validate({}, raise_exceptions=False) == []
+
+    schema_file.write_text('{"type": "object", "required": ["a"]}', encoding="utf-8")
+    errors = Validator(schema=schema_file).validate({}, raise_exceptions=False)
+    assert errors and errors[0].validator == "required"
+
+
+def test_validator_schema_cache_tracks_referenced_file_changes(tmp_path):
+    """Editing a $ref'd file invalidates the cached entry instead of adding one."""
+    schema_file = tmp_path / "main.json"
+    schema_file.write_text('{"$ref": "sub.json"}', encoding="utf-8")
+    sub_file = tmp_path / "sub.json"
+    sub_file.write_text('{"type": "object"}', encoding="utf-8")
+    assert Validator(schema=schema_file).validate({}, raise_exceptions=False) == []
+    cache_size = len(_RESOLVED_SCHEMA_CACHE)
+
+    sub_file.write_text('{"type": "object", "required": ["a"]}', encoding="utf-8")
+    errors = Validator(schema=schema_file).validate({}, raise_exceptions=False)
+    assert errors and errors[0].validator == "required"
+    assert len(_RESOLVED_SCHEMA_CACHE) == cache_size
+
+
+def test_error_detail_suggestion_dispatch():
+    """Suggestions are built per validator keyword; unknown keywords get none."""
+    detail = ValidationErrorDetail(
+        message="too long",
+        validator="maxLength",
+        validator_value=3,
+        instance_value="abcd",
+    )
+    assert detail.suggestion == (
+        "Ensure value has at most 3 characters/items (currently 4)."
+    )
+    detail = ValidationErrorDetail(
+        message="out of range", validator="exclusiveMinimum", validator_value=0
+    )
+    assert detail.suggestion == "Ensure value is strictly greater than 0."
+    detail = ValidationErrorDetail(message="no rule", validator="uniqueItems")
+    assert detail.suggestion is None
+
+
+def test_inline_refs_skips_instance_keywords(tmp_path):
+    """$refs inside instance data are kept; same-named properties are inlined."""
+    (tmp_path / "string.schema.json").write_text('{"type": "string"}', encoding="utf-8")
+    schema = {
+        "properties": {"default": {"$ref": "string.schema.json"}},
+        "examples": [{"default": {"$ref": "missing.schema.json"}}],
+    }
+    resolved = inline_refs(schema, tmp_path, {})
+    assert resolved["properties"]["default"] == {"type": "string"}
+    assert resolved["examples"] == schema["examples"]
+
+
+def test_validate_unresolvable_ref_raises():
+    """An unresolvable $ref is reported without touching deprecated jsonschema API."""
+    validator_instance = Validator(schema={"$ref": "missing.schema.json"})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        with pytest.raises(SignalJourneyValidationError) as excinfo:
+            validator_instance.validate({}, raise_exceptions=False)
+    assert "could not resolve reference" in str(excinfo.value)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_error_detail_uses_slots():
+    """ValidationErrorDetail instances carry no per-instance __dict__."""
+    detail = ValidationErrorDetail(message="m", validator="required")
+    assert not hasattr(detail, "__dict__")
+    assert detail.suggestion
+
+
+def _enum_detail(instance_value: str) -> ValidationErrorDetail:
+    return ValidationErrorDetail(
+        message="not allowed",
+        validator="enum",
+        validator_value=["EEG", "MEG", 3],
+        instance_value=instance_value,
+    )
+
+
+def test_error_detail_enum_suggestion_uses_fuzzy_match(monkeypatch):
+    """Enum suggestions add the closest allowed string found by fuzzywuzzy."""
+    calls = []
+
+    def extract_one(query, choices):
+        calls.append((query, choices))
+        return ("EEG", 90 if query == "EGG" else 50)
+
+    fake_process = types.ModuleType("fuzzywuzzy.process")
+    fake_process.extractOne = extract_one
+    fake_package = types.ModuleType("fuzzywuzzy")
+    fake_package.process = fake_process
+    monkeypatch.setitem(sys.modules, "fuzzywuzzy", fake_package)
+    monkeypatch.setitem(sys.modules, "fuzzywuzzy.process", fake_process)
+    monkeypatch.setattr(errors_module, "HAS_FUZZY", True)
+    monkeypatch.setattr(errors_module, "_fuzzy_process", None)
+
+    assert _enum_detail("EGG").suggestion == (
+        "Value must be one of: 'EEG', 'MEG', 3. Did you mean 'EEG'?"
+    )
+    assert _enum_detail("xyz").suggestion == "Value must be one of: 'EEG', 'MEG', 3."
+    assert calls == [("EGG", ["EEG", "MEG"]), ("xyz", ["EEG", "MEG"])]
+    assert errors_module._fuzzy_process is fake_process
+
+
+def test_error_detail_enum_suggestion_without_importable_fuzzy(monkeypatch):
+    """A fuzzywuzzy that fails to import is given up on after the first try."""
+    monkeypatch.setitem(sys.modules, "fuzzywuzzy", None)  # import raises
+    monkeypatch.setattr(errors_module, "HAS_FUZZY", True)
+    monkeypatch.setattr(errors_module, "_fuzzy_process", None)
+
+    assert _enum_detail("EGG").suggestion == "Value must be one of: 'EEG', 'MEG', 3."
+    assert errors_module.HAS_FUZZY is False
+
+
+def test_import_does_not_load_fuzzywuzzy(tmp_path):
+    """Importing the package only locates fuzzywuzzy, without importing it."""
+    fake_package = tmp_path / "fuzzywuzzy"
+    fake_package.mkdir()
+    (fake_package / "__init__.py").write_text(
+        "raise AssertionError('fuzzywuzzy imported')", encoding="utf-8"
+    )
+    code = (
+        "import sys, signaljourney_validator.errors as errors; "
+        "assert errors.HAS_FUZZY; assert 'fuzzywuzzy' not in sys.modules"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), *sys.path])}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)